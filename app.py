@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import atexit
 import csv
-from dataclasses import dataclass
+import functools
+import hashlib
+import hmac
+import io
+import mmap
+import os
+import re
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Tuple
 
 
 # -----------------------------
@@ -11,9 +20,14 @@ from typing import Dict, List, Tuple
 # -----------------------------
 USERS_FILE = Path("users.csv")
 MOVIES_FILE = Path("movies.csv")
+MOVIES_INDEX_FILE = Path("movies.idx")  # sidecar: username -> line offsets
 
 USERS_FIELDS = ["username", "password"]
 MOVIES_FIELDS = ["username", "movie_name", "director", "genre", "rating", "year", "watched"]
+INDEX_FIELDS = ["username", "offset", "length"]
+
+# Column positions within a movies.csv row tuple (same order as MOVIES_FIELDS)
+_U, _MN, _DIR, _GENRE, _RATING, _YEAR, _W = range(len(MOVIES_FIELDS))
 
 # Basic validation bounds
 MIN_YEAR = 1888
@@ -21,11 +35,15 @@ MAX_YEAR = 2100
 MIN_RATING = 0.0
 MAX_RATING = 10.0
 
+# Shape checks run before any numeric conversion (bounds above still apply)
+_RATING_RE = re.compile(r"^(?:10(?:\.0+)?|[0-9](?:\.[0-9]+)?)$")
+_YEAR_RE = re.compile(r"^(?:18[89][0-9]|19[0-9]{2}|20[0-9]{2}|2100)$")
+
 
 # -----------------------------
 # Data model
 # -----------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Movie:
     username: str
     movie_name: str
@@ -36,38 +54,63 @@ class Movie:
     watched: str # "Y" or "N"
 
 
+@dataclass
+class Session:
+    """Logged-in user plus a snapshot of their movies, shared by the menus."""
+    username: str
+    movies: List[Movie] = field(default_factory=list)
+    mtime_ns: int = -1  # movies.csv mtime when `movies` was loaded; -1 = stale
+
+
 # -----------------------------
 # File bootstrap
 # -----------------------------
-def ensure_csv_file(path: Path, header: List[str], seed_rows: List[dict] | None = None) -> None:
-    """Create a CSV file with the given header if it doesn't exist."""
-    if path.exists():
+def _write_rows(f, rows: Iterable[Iterable], header: List[str] = MOVIES_FIELDS) -> None:
+    """Write header + positional rows (already in header order) to an open text file."""
+    writer = csv.writer(f)
+    writer.writerow(header)
+    writer.writerows(rows)
+
+
+def ensure_csv_file(path: Path, header: List[str], seed_rows: List[Tuple[str, ...]] | None = None) -> None:
+    """Create a CSV file with the given header (and optional seed row tuples) if it doesn't exist."""
+    try:
+        # O_EXCL: existence check and creation in one atomic open
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
         return
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=header)
-        writer.writeheader()
-        if seed_rows:
-            for row in seed_rows:
-                writer.writerow(row)
+    with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+        _write_rows(f, seed_rows or [], header)
 
 
 # -----------------------------
 # Users / Login
 # -----------------------------
-def load_users() -> Dict[str, str]:
-    """Load users.csv into a dict: {username: password}."""
-    users: Dict[str, str] = {}
-    with USERS_FILE.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+def _hash_password(password: str) -> bytes:
+    """Digest used to hold and compare passwords in memory."""
+    return hashlib.blake2b(password.encode("utf-8"), digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_users_cached(path: Path, mtime_ns: int) -> Dict[str, bytes]:
+    """Parse a users CSV; cached per (path, modification time)."""
+    users: Dict[str, bytes] = {}
+    with path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
         for row in reader:
-            u = (row.get("username") or "").strip()
-            p = (row.get("password") or "").strip()
+            u = row[0].strip() if row else ""
             if u:
-                users[u] = p
+                users[u] = _hash_password(row[1].strip() if len(row) > 1 else "")
     return users
 
 
-def authenticate(users: Dict[str, str]) -> str:
+def load_users() -> Dict[str, bytes]:
+    """Load users.csv into a dict: {username: password digest} (shared, do not mutate)."""
+    return _load_users_cached(USERS_FILE, USERS_FILE.stat().st_mtime_ns)
+
+
+def authenticate(users: Dict[str, bytes]) -> str:
     """Login loop. Returns username on success."""
     print("=================================")
     print(" Welcome to Personal Movie List ")
@@ -76,11 +119,13 @@ def authenticate(users: Dict[str, str]) -> str:
     print(" Create a list of movies you want to watch ")
     print("=================================")
 
+    get_user = users.get
     while True:
-        username = input("Username: ").strip()
-        password = input("Password: ").strip()
+        username = _input("Username: ").strip()
+        password = _input("Password: ").strip()
 
-        if username in users and users[username] == password:
+        stored = get_user(username)
+        if stored is not None and hmac.compare_digest(stored, _hash_password(password)):
             print(f"\nLogin successful. Welcome, {username}!\n")
             return username
 
@@ -90,72 +135,444 @@ def authenticate(users: Dict[str, str]) -> str:
 # -----------------------------
 # Movies (load / save)
 # -----------------------------
+# Reused writer so serialized lines use exactly the same quoting/terminator
+# as the csv.writer that writes movies.csv.
+_LINE_BUFFER = io.StringIO()
+_LINE_WRITER = csv.writer(_LINE_BUFFER)
+
+
+def _movie_to_tuple(mv: Movie) -> Tuple[str, ...]:
+    """Return a Movie's fields in MOVIES_FIELDS order."""
+    return (mv.username, mv.movie_name, mv.director, mv.genre, mv.rating, mv.year, mv.watched)
+
+
+def _serialize_fields(fields: Iterable[str]) -> bytes:
+    """Return the CSV line (with terminator) for the given fields."""
+    _LINE_BUFFER.seek(0)
+    _LINE_BUFFER.truncate()
+    _LINE_WRITER.writerow(fields)
+    return _LINE_BUFFER.getvalue().encode("utf-8")
+
+
+def _serialize_movie_row(mv: Movie) -> bytes:
+    """Return the exact CSV line (with terminator) movies.csv stores for a Movie, in canonical form."""
+    return _serialize_fields(_canonical_row(_movie_to_tuple(mv)))
+
+
+def _padded_movie_line(mv: Movie, length: int, terminator: bytes) -> bytes | None:
+    """
+    Serialize a Movie to exactly `length` bytes (terminator included) so it can
+    overwrite an existing line in place. A row of exactly that length is
+    written as its plain canonical line; a shorter one has its last field
+    quoted and padded with spaces inside the quotes (stripped again on read).
+    Returns None if the row does not fit.
+    """
+    plain = _serialize_movie_row(mv).rstrip(b"\r\n") + terminator
+    if len(plain) == length:
+        return plain
+    if len(plain) > length:
+        return None
+
+    row = _canonical_row(_movie_to_tuple(mv))
+    head = _serialize_fields(row[:_W]).rstrip(b"\r\n")
+    watched = row[_W].replace('"', '""').encode("utf-8")
+    pad = length - (len(head) + len(watched) + len(terminator) + 3)  # comma + 2 quotes
+    if pad < 0:
+        return None
+    return head + b',"' + watched + b" " * pad + b'"' + terminator
+
+
+# Lazily opened append handle for movies.csv, kept open across appends.
+_append_fh: IO[bytes] | None = None
+
+
+def _get_append_fh() -> IO[bytes]:
+    """Return the shared buffered append handle for movies.csv (opened on first use)."""
+    global _append_fh
+    if _append_fh is None:
+        _append_fh = MOVIES_FILE.open("ab", buffering=1 << 16)
+    return _append_fh
+
+
+def _flush_appends() -> None:
+    """Push buffered appends to movies.csv; call before reading the file."""
+    if _append_fh is not None:
+        _append_fh.flush()
+    _commit_pending_index()
+
+
+def _close_append_fh() -> None:
+    """Flush and close the append handle; call before movies.csv is replaced."""
+    global _append_fh
+    if _append_fh is not None:
+        _append_fh.close()
+        _append_fh = None
+    _commit_pending_index()
+
+
+atexit.register(_close_append_fh)
+
+
+# In-memory copy of movies.idx and the (size, mtime_ns) of movies.csv it
+# describes; index rows for appends still in the buffer are held back until
+# those appends are flushed.
+_movie_index: Dict[str, List[Tuple[int, int]]] | None = None
+_movie_index_stamp: Tuple[int, int] | None = None
+_pending_index_rows: List[Tuple[str, int, int]] = []
+
+
+_QUOTE, _COMMA, _NEWLINE = ord('"'), ord(","), ord("\n")
+
+
+def _record_end(mm: mmap.mmap, start: int) -> int:
+    """
+    Return the end (after the newline) of the CSV record starting at start.
+    Lines without a quote end at their newline. Otherwise the record is
+    scanned the way csv.reader reads it: a quote only opens a quoted field
+    at the start of a field ("" inside it is an escaped quote), and only a
+    newline outside a quoted field ends the record.
+    """
+    size = len(mm)
+    nl = mm.find(b"\n", start)
+    end = size if nl == -1 else nl + 1
+    if mm.find(b'"', start, end) == -1:
+        return end
+
+    pos = start
+    field_start = True
+    quoted = False
+    while pos < size:
+        c = mm[pos]
+        if quoted:
+            if c == _QUOTE:
+                if pos + 1 < size and mm[pos + 1] == _QUOTE:
+                    pos += 2
+                    continue
+                quoted = False
+        elif c == _NEWLINE:
+            return pos + 1
+        elif c == _QUOTE and field_start:
+            quoted = True
+        field_start = not quoted and c == _COMMA
+        pos += 1
+    return size
+
+
+def _record_spans(mm: mmap.mmap, start: int) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) of each CSV record in mm from start on; end includes the newline."""
+    size = len(mm)
+    while start < size:
+        end = _record_end(mm, start)
+        yield start, end
+        start = end
+
+
+def _open_mmap(f) -> mmap.mmap | None:
+    """Read-only mmap of an open binary file, or None if it is empty."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return None
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _build_index() -> Dict[str, List[Tuple[int, int]]]:
+    """Scan movies.csv once and map each username to its (offset, length) lines."""
+    index: Dict[str, List[Tuple[int, int]]] = {}
+    with MOVIES_FILE.open("rb") as f:
+        mm = _open_mmap(f)
+        if mm is None:
+            return index
+        with mm:
+            spans = _record_spans(mm, 0)
+            next(spans, None)  # header
+            for start, end in spans:
+                if mm[start:start + 1] == b'"':
+                    username = _parse_line(mm[start:end])[_U]
+                else:
+                    comma = mm.find(b",", start, end)
+                    head = mm[start:end if comma == -1 else comma]
+                    if comma == -1 and not head.strip():
+                        continue  # blank line
+                    username = head.decode("utf-8").strip()
+                index.setdefault(username, []).append((start, end - start))
+            return index
+
+
+def _save_index(index: Dict[str, List[Tuple[int, int]]]) -> None:
+    """Rewrite movies.idx from the given index."""
+    with MOVIES_INDEX_FILE.open("w", newline="", encoding="utf-8") as f:
+        _write_rows(
+            f,
+            ((username, offset, length) for username, entries in index.items() for offset, length in entries),
+            INDEX_FIELDS,
+        )
+
+
+def _read_index_file(stamp: Tuple[int, int]) -> Dict[str, List[Tuple[int, int]]] | None:
+    """
+    Read movies.idx if it still describes movies.csv with the given
+    (size, mtime_ns): it must be written no earlier than movies.csv was last
+    modified and its rows must end exactly at the file size. Returns None if
+    it is missing, unreadable or stale.
+    """
+    size, mtime_ns = stamp
+    index: Dict[str, List[Tuple[int, int]]] = {}
+    end = 0
+    try:
+        if MOVIES_INDEX_FILE.stat().st_mtime_ns < mtime_ns:
+            return None
+        with MOVIES_INDEX_FILE.open("r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header
+            for username, offset, length in reader:
+                off, ln = int(offset), int(length)
+                index.setdefault(username, []).append((off, ln))
+                end = max(end, off + ln)
+    except (OSError, ValueError):
+        return None
+    if not index or end != size:
+        return None
+    return index
+
+
+def _load_index() -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Return the username -> [(offset, length)] index for movies.csv.
+    Uses the in-memory copy or movies.idx only while movies.csv still has the
+    size and mtime they were built for; otherwise rebuilds it with one scan
+    and rewrites movies.idx.
+    """
+    global _movie_index, _movie_index_stamp
+    _flush_appends()
+    st = MOVIES_FILE.stat()
+    stamp = (st.st_size, st.st_mtime_ns)
+
+    if _movie_index is None or _movie_index_stamp != stamp:
+        index = _read_index_file(stamp)
+        if index is None:
+            index = _build_index()
+            _save_index(index)
+        _movie_index, _movie_index_stamp = index, stamp
+
+    return _movie_index
+
+
+def _stamp_index() -> None:
+    """
+    Record that the index matches movies.csv as it is now. Call only right
+    after this process changed movies.csv and updated the index to match.
+    """
+    global _movie_index_stamp
+    if _movie_index is None:
+        return
+    st = MOVIES_FILE.stat()
+    _movie_index_stamp = (st.st_size, st.st_mtime_ns)
+    if MOVIES_INDEX_FILE.exists():
+        os.utime(MOVIES_INDEX_FILE)  # keep the sidecar newer than movies.csv
+
+
+def _commit_pending_index() -> None:
+    """
+    Write index rows of just-flushed appends to movies.idx and restamp.
+    If movies.csv does not end where those rows say (another process
+    appended meanwhile), the offsets are wrong: drop the index instead.
+    """
+    if not _pending_index_rows:
+        return
+    rows = list(_pending_index_rows)
+    _pending_index_rows.clear()
+    if _movie_index is None:
+        return
+    _username, offset, length = rows[-1]
+    if MOVIES_FILE.stat().st_size != offset + length:
+        _invalidate_index()
+        return
+    if MOVIES_INDEX_FILE.exists():
+        with MOVIES_INDEX_FILE.open("a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(rows)
+    else:
+        _save_index(_movie_index)
+    _stamp_index()
+
+
+def _invalidate_index() -> None:
+    """Drop the index after movies.csv was rewritten; it is rebuilt on next use."""
+    global _movie_index, _movie_index_stamp
+    _movie_index = None
+    _movie_index_stamp = None
+    try:
+        MOVIES_INDEX_FILE.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _read_spans(spans: List[Tuple[int, int]]) -> List[str]:
+    """Copy the given (offset, length) records out of movies.csv as text."""
+    with MOVIES_FILE.open("rb") as f:
+        mm = _open_mmap(f)
+        if mm is None:
+            return []
+        with mm:
+            return [mm[offset:offset + length].decode("utf-8") for offset, length in spans]
+
+
+def iter_movies_for_user(username: str, chunk_size: int = 4096) -> Iterator[List[Movie]]:
+    """
+    Yield this user's movies in lists of at most chunk_size, reading only
+    their indexed lines, so memory stays bounded however many rows they own.
+    movies.csv is not held open across yields, but offsets are: raises
+    RuntimeError if the file changes mid-iteration (collect rows first if
+    you need to update/delete them). If the index turns out not to match the
+    file, it is rebuilt and reading restarts, or RuntimeError is raised if
+    chunks were already yielded.
+    """
+    entries = _load_index().get(username, [])
+    stamp = _movie_index_stamp
+    yielded = False
+    rebuilt = False
+    i = 0
+
+    while i < len(entries):
+        if i:
+            _load_index()
+            if _movie_index_stamp != stamp:
+                raise RuntimeError("movies.csv changed while iterating over its rows")
+        lines = _read_spans(entries[i:i + chunk_size])
+        # One csv.reader per chunk; Movie built positionally.
+        try:
+            rows = [_canonical_row(row) for row in csv.reader(lines)]
+        except csv.Error:
+            rows = []
+        if len(rows) != len(lines) or any(row[_U] != username for row in rows):
+            _invalidate_index()  # offsets no longer match the file
+            if yielded or rebuilt:
+                raise RuntimeError("movies.idx did not match movies.csv")
+            entries = _load_index().get(username, [])
+            stamp = _movie_index_stamp
+            rebuilt = True
+            i = 0
+            continue
+
+        yield [Movie(username, mn, d, g, ra, y, w) for (_u, mn, d, g, ra, y, w) in rows]
+        yielded = True
+        i += chunk_size
+
+
 def load_movies_for_user(username: str) -> List[Movie]:
-    """Read movies.csv and return Movie objects for the given user."""
-    movies: List[Movie] = []
-    with MOVIES_FILE.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if (row.get("username") or "").strip() != username:
-                continue
+    """Read this user's lines from movies.csv (via the index) as Movie objects."""
+    return [mv for chunk in iter_movies_for_user(username) for mv in chunk]
+
+
+def append_movies(movies: Iterable[Movie]) -> None:
+    """
+    Append movie rows to movies.csv through the shared buffered handle and
+    record them in the index. Rows reach the file when the buffer fills, a
+    reader flushes it, or the program exits; their movies.idx rows are
+    written when they are flushed.
+    """
+    index = _load_index()  # also flushes earlier appends
+    new_entries: List[Tuple[str, int, int]] = []
 
-            movies.append(Movie(
-                username=username,
-                movie_name=(row.get("movie_name") or "").strip(),
-                director=(row.get("director") or "").strip(),
-                genre=(row.get("genre") or "").strip(),
-                rating=(row.get("rating") or "").strip(),
-                year=(row.get("year") or "").strip(),
-                watched=(row.get("watched") or "").strip().upper(),
-            ))
-    return movies
+    f = _get_append_fh()
+    # tell() on a long-lived "ab" handle is where it last wrote, not the
+    # current end of file if another process appended since.
+    offset = os.fstat(f.fileno()).st_size
+    for movie in movies:
+        line = _serialize_movie_row(movie)
+        f.write(line)
+        new_entries.append((movie.username, offset, len(line)))
+        offset += len(line)
+
+    for username, off, length in new_entries:
+        index.setdefault(username, []).append((off, length))
+    _pending_index_rows.extend(new_entries)
 
 
 def append_movie(movie: Movie) -> None:
-    """Append a new movie row to movies.csv."""
-    with MOVIES_FILE.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=MOVIES_FIELDS)
-        writer.writerow({
-            "username": movie.username,
-            "movie_name": movie.movie_name,
-            "director": movie.director,
-            "genre": movie.genre,
-            "rating": movie.rating,
-            "year": movie.year,
-            "watched": movie.watched,
-        })
-
-
-def load_all_movie_rows() -> List[dict]:
-    """Load all rows from movies.csv as dicts (including other users)."""
-    rows: List[dict] = []
-    with MOVIES_FILE.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append({k: (row.get(k) or "") for k in MOVIES_FIELDS})
-    return rows
-
-
-def save_all_movie_rows(rows: List[dict]) -> None:
-    """Rewrite movies.csv with the given rows."""
-    with MOVIES_FILE.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=MOVIES_FIELDS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow({k: (row.get(k) or "") for k in MOVIES_FIELDS})
-
-
-def movie_row_matches(row: dict, mv: Movie) -> bool:
-    """Match a CSV row to a Movie by all fields (safe for duplicates)."""
-    return (
-        (row.get("username") or "").strip() == mv.username
-        and (row.get("movie_name") or "").strip() == mv.movie_name
-        and (row.get("director") or "").strip() == mv.director
-        and (row.get("genre") or "").strip() == mv.genre
-        and (row.get("rating") or "").strip() == mv.rating
-        and (row.get("year") or "").strip() == mv.year
-        and (row.get("watched") or "").strip().upper() == (mv.watched or "").strip().upper()
-    )
+    """Append a new movie row to movies.csv and record it in the index."""
+    append_movies([movie])
+
+
+def _fixed_arity(row: List[str] | Tuple[str, ...]) -> Tuple[str, ...]:
+    """Pad/trim a parsed CSV row to exactly len(MOVIES_FIELDS) columns."""
+    n = len(MOVIES_FIELDS)
+    return tuple(row[:n]) + ("",) * (n - len(row))
+
+
+_strip = str.strip  # bound once; map(_strip, row) strips every cell in C
+
+
+def _canonical_row(row: List[str] | Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Canonical stored form of a row: fixed arity, stripped fields, watched
+    upper-cased. Rows are canonicalized once when read and written only in
+    this form, so matching is plain tuple equality.
+    """
+    if len(row) != len(MOVIES_FIELDS):
+        row = _fixed_arity(row)
+    u, mn, d, g, ra, y, w = map(_strip, row)
+    return (u, mn, d, g, ra, y, w.upper())
+
+
+def _parse_line(line: bytes) -> Tuple[str, ...]:
+    """Parse one raw movies.csv line into a canonical row tuple."""
+    return _canonical_row(next(csv.reader([line.decode("utf-8")]), []))
+
+
+def _movie_key(mv: Movie) -> Tuple[str, ...]:
+    """Comparison key of a Movie; equals the canonical row it was loaded from."""
+    return _movie_to_tuple(mv)
+
+
+def _row_matcher(target: Tuple[str, ...]) -> Callable[[bytes], bool]:
+    """Build a predicate for raw movies.csv records whose row key equals target."""
+
+    def matches(line: bytes) -> bool:
+        return _parse_line(line) == target
+
+    return matches
+
+
+def _rewrite_filtered(transform: Callable[[bytes], bytes | None], spans: List[Tuple[int, int]]) -> bool:
+    """
+    Rewrite movies.csv through a temp file (swapped in with os.replace).
+    Only the records at the given (offset, length) spans (in file order, e.g.
+    one user's index entries) are sliced out and passed to transform(line),
+    which returns the line itself (keep), None (drop) or a replacement line.
+    Only the first non-keep result is applied; everything else is copied
+    verbatim in bulk. Returns True if a record was changed (file rewritten).
+    """
+    _close_append_fh()  # flush pending rows; the handle would outlive os.replace
+    tmp_path = MOVIES_FILE.with_suffix(".csv.tmp")
+    changed = False
+
+    try:
+        with MOVIES_FILE.open("rb") as src:
+            mm = _open_mmap(src)
+            if mm is None:
+                return False
+            with mm:
+                for start, length in spans:
+                    end = start + length
+                    line = mm[start:end]
+                    new_line = transform(line)
+                    if new_line is line:
+                        continue
+                    # memoryview slices copy straight from the mapping, no bytes copy
+                    with tmp_path.open("wb") as dst, memoryview(mm) as view:
+                        dst.write(view[:start])
+                        if new_line is not None:
+                            dst.write(new_line)
+                        dst.write(view[end:])
+                    changed = True
+                    break
+
+        if changed:
+            os.replace(tmp_path, MOVIES_FILE)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return changed
 
 
 def delete_movie_record(username: str, movie_to_delete: Movie) -> bool:
@@ -163,20 +580,44 @@ def delete_movie_record(username: str, movie_to_delete: Movie) -> bool:
     Delete ONE matching movie record for this user from movies.csv.
     Returns True if deleted, False if not found.
     """
-    rows = load_all_movie_rows()
-    deleted = False
-    new_rows: List[dict] = []
+    if movie_to_delete.username != username:
+        return False
+    matches = _row_matcher(_movie_key(movie_to_delete))
+    deleted = _rewrite_filtered(
+        lambda line: None if matches(line) else line,
+        _load_index().get(username, []),
+    )
+    if deleted:
+        _invalidate_index()
+    return deleted
 
-    for row in rows:
-        if not deleted and (row.get("username") or "").strip() == username and movie_row_matches(row, movie_to_delete):
-            deleted = True
-            continue
-        new_rows.append(row)
 
-    if deleted:
-        save_all_movie_rows(new_rows)
+def _overwrite_in_place(username: str, target: Tuple[str, ...], new_movie: Movie) -> bool | None:
+    """
+    Overwrite the first indexed line of this user matching target with
+    new_movie, padded to the same byte length, without rewriting the file.
+    Returns True if overwritten, False if no line matches, or None if the
+    new row is longer than the old line (caller must rewrite the file).
+    """
+    entries = _load_index().get(username, [])
+    with MOVIES_FILE.open("r+b") as f:
+        for offset, length in entries:
+            f.seek(offset)
+            line = f.read(length)
+            if _parse_line(line) != target:
+                continue
 
-    return deleted
+            terminator = line[len(line.rstrip(b"\r\n")):]
+            padded = _padded_movie_line(new_movie, length, terminator)
+            if padded is None:
+                return None
+            f.seek(offset)
+            f.write(padded)
+            break
+        else:
+            return False
+    _stamp_index()  # same size and offsets; only the mtime moved
+    return True
 
 
 def update_movie_record(username: str, old_movie: Movie, new_movie: Movie) -> bool:
@@ -184,75 +625,80 @@ def update_movie_record(username: str, old_movie: Movie, new_movie: Movie) -> bo
     Update ONE matching movie record for this user in movies.csv.
     Returns True if updated, False if not found.
     """
-    rows = load_all_movie_rows()
-    updated = False
-
-    for row in rows:
-        if not updated and (row.get("username") or "").strip() == username and movie_row_matches(row, old_movie):
-            # Replace fields (keep username consistent)
-            row["username"] = username
-            row["movie_name"] = new_movie.movie_name
-            row["director"] = new_movie.director
-            row["genre"] = new_movie.genre
-            row["rating"] = new_movie.rating
-            row["year"] = new_movie.year
-            row["watched"] = new_movie.watched
-            updated = True
-            break
-
+    if old_movie.username != username:
+        return False
+    target = _movie_key(old_movie)
+    # Replace fields (keep username consistent)
+    new_movie = replace(new_movie, username=username)
+
+    # Fast path: same-or-shorter row overwrites its line; offsets stay valid.
+    in_place = _overwrite_in_place(username, target, new_movie)
+    if in_place is not None:
+        return in_place
+
+    matches = _row_matcher(target)
+    replacement = _serialize_movie_row(new_movie)
+    updated = _rewrite_filtered(
+        lambda line: replacement if matches(line) else line,
+        _load_index().get(username, []),
+    )
     if updated:
-        save_all_movie_rows(rows)
-
+        _invalidate_index()
     return updated
 
 
 # -----------------------------
 # CLI helpers
 # -----------------------------
+def _input(prompt: str) -> str:
+    """input() replacement reading stdin directly (no readline setup per call)."""
+    print(prompt, end="", flush=True)
+    line = sys.stdin.readline()  # looked up per call so a replaced sys.stdin is honored
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
+
+
 def prompt_non_empty(prompt: str) -> str:
     while True:
-        v = input(prompt).strip()
+        v = _input(prompt).strip()
         if v:
             return v
         print("This field cannot be empty. Please try again.")
 
 
 def prompt_optional(prompt: str) -> str:
-    return input(prompt).strip()
+    return _input(prompt).strip()
 
 
 def prompt_rating(prompt: str) -> str:
     """Optional rating. If provided: numeric 0..10. Stored as text."""
     while True:
-        v = input(prompt).strip()
+        v = _input(prompt).strip()
         if v == "":
             return ""
-        try:
-            r = float(v)
-            if MIN_RATING <= r <= MAX_RATING:
-                return str(int(r)) if r.is_integer() else str(r)
-        except ValueError:
-            pass
+        ok, normalized = validate_rating_input(v)
+        if ok:
+            return normalized
         print(f"Invalid rating. Enter a number between {MIN_RATING} and {MAX_RATING}, or leave blank.")
 
 
 def prompt_year(prompt: str) -> str:
     """Optional year. If provided: integer 1888..2100. Stored as text."""
     while True:
-        v = input(prompt).strip()
+        v = _input(prompt).strip()
         if v == "":
             return ""
-        if v.isdigit():
-            yr = int(v)
-            if MIN_YEAR <= yr <= MAX_YEAR:
-                return v
+        ok, normalized = validate_year_input(v)
+        if ok:
+            return normalized
         print(f"Invalid year. Enter a number between {MIN_YEAR} and {MAX_YEAR}, or leave blank.")
 
 
 def prompt_watched(prompt: str) -> str:
     """Required Y/N."""
     while True:
-        v = input(prompt).strip().upper()
+        v = _input(prompt).strip().upper()
         if v in {"Y", "N"}:
             return v
         print("Invalid input. Please enter Y or N.")
@@ -261,7 +707,7 @@ def prompt_watched(prompt: str) -> str:
 def confirm_yes_no(prompt: str) -> bool:
     """Return True for Y, False for N."""
     while True:
-        v = input(prompt).strip().upper()
+        v = _input(prompt).strip().upper()
         if v in {"Y", "N"}:
             return v == "Y"
         print("Please enter Y or N.")
@@ -301,7 +747,7 @@ def prompt_edit_field(label: str, current_value: str, validator=None) -> str:
     - Otherwise validate (if validator provided) and return new value
     """
     while True:
-        v = input(f"{label} [{current_value if current_value else '-'}] (press Enter to keep): ").strip()
+        v = _input(f"{label} [{current_value if current_value else '-'}] (press Enter to keep): ").strip()
         if v == "":
             return current_value
         if validator:
@@ -314,20 +760,16 @@ def prompt_edit_field(label: str, current_value: str, validator=None) -> str:
 
 
 def validate_rating_input(v: str) -> Tuple[bool, str]:
-    try:
+    if _RATING_RE.match(v) is not None:
         r = float(v)
         if MIN_RATING <= r <= MAX_RATING:
             return True, (str(int(r)) if r.is_integer() else str(r))
-    except ValueError:
-        pass
     return False, f"Invalid rating. Enter {MIN_RATING}–{MAX_RATING}."
 
 
 def validate_year_input(v: str) -> Tuple[bool, str]:
-    if v.isdigit():
-        yr = int(v)
-        if MIN_YEAR <= yr <= MAX_YEAR:
-            return True, v
+    if _YEAR_RE.match(v) is not None and MIN_YEAR <= int(v) <= MAX_YEAR:
+        return True, v
     return False, f"Invalid year. Enter {MIN_YEAR}–{MAX_YEAR}."
 
 
@@ -341,7 +783,16 @@ def validate_watched_input(v: str) -> Tuple[bool, str]:
 # -----------------------------
 # Commands
 # -----------------------------
-def view_movies(username: str) -> None:
+def _refresh(session: Session) -> None:
+    """Reload session.movies only if movies.csv changed since the snapshot."""
+    _flush_appends()
+    mtime_ns = MOVIES_FILE.stat().st_mtime_ns
+    if mtime_ns != session.mtime_ns:
+        session.movies = load_movies_for_user(session.username)
+        session.mtime_ns = mtime_ns
+
+
+def view_movies(session: Session) -> None:
     """
     View Movies (two-level + delete + edit from details):
     - Show numbered titles list
@@ -353,9 +804,12 @@ def view_movies(username: str) -> None:
         * D -> delete this movie (double-confirm)
         * Enter -> back to movie list
     """
+    username = session.username
+
     while True:
         print("\n--- View Movies ---")
-        movies = load_movies_for_user(username)
+        _refresh(session)
+        movies = session.movies
 
         if not movies:
             print("No movies found.\n")
@@ -366,7 +820,7 @@ def view_movies(username: str) -> None:
             print(f"{i}. {title}")
 
         print("\nEnter a movie number to view details, or B to go back to Home.")
-        choice = input("Your choice: ").strip().lower()
+        choice = _input("Your choice: ").strip().lower()
 
         if choice in {"b", "back"}:
             print()
@@ -380,7 +834,7 @@ def view_movies(username: str) -> None:
                 while True:
                     print_movie_details(selected)
                     print("Options: [E] Edit   [D] Delete   [Enter] Back to movie list")
-                    sub = input("Your choice: ").strip().lower()
+                    sub = _input("Your choice: ").strip().lower()
 
                     if sub in {"", "b", "back"}:
                         break
@@ -389,6 +843,7 @@ def view_movies(username: str) -> None:
                         if confirm_yes_no("Are you sure you want to delete this movie? (Y/N): "):
                             if delete_movie_record(username, selected):
                                 print("\nDeleted successfully.\n")
+                                session.mtime_ns = -1
                             else:
                                 print("\nDelete failed: movie not found.\n")
                             break  # back to movie list (refresh)
@@ -420,6 +875,7 @@ def view_movies(username: str) -> None:
                         if confirm_yes_no("Save changes? (Y/N): "):
                             if update_movie_record(username, selected, updated_movie):
                                 print("\nUpdated successfully.\n")
+                                session.mtime_ns = -1
                                 # Update in-memory selected so details reflect changes immediately
                                 selected = updated_movie
                             else:
@@ -457,20 +913,23 @@ def add_movie(username: str) -> None:
     )
 
     append_movie(movie)
+    _flush_appends()  # confirmed adds must be on disk, not just in the buffer
     print("\nMovie added successfully.\n")
 
 
-def delete_movie_from_home(username: str) -> None:
+def delete_movie_from_home(session: Session) -> None:
     """
     Delete Movie (Home menu):
     - Show titles list
     - Ask for movie number to delete or B to cancel
     - Show details + confirm
     """
+    username = session.username
+
     while True:
         print("\n--- Delete Movie ---")
-        movies = load_movies_for_user(username)
-
+        _refresh(session)
+        movies = session.movies
         if not movies:
             print("No movies found.\n")
             return
@@ -480,7 +939,7 @@ def delete_movie_from_home(username: str) -> None:
             print(f"{i}. {title}")
 
         print("\nEnter a movie number to delete, or B to go back to Home.")
-        choice = input("Your choice: ").strip().lower()
+        choice = _input("Your choice: ").strip().lower()
 
         if choice in {"b", "back"}:
             print()
@@ -494,6 +953,7 @@ def delete_movie_from_home(username: str) -> None:
                 if confirm_yes_no("Are you sure you want to delete this movie? (Y/N): "):
                     if delete_movie_record(username, target):
                         print("\nDeleted successfully.\n")
+                        session.mtime_ns = -1
                     else:
                         print("\nDelete failed: movie not found.\n")
                     return
@@ -504,7 +964,7 @@ def delete_movie_from_home(username: str) -> None:
         print("\nInvalid input. Please enter a valid movie number or B.\n")
 
 
-def home_menu(username: str) -> None:
+def home_menu(session: Session) -> None:
     """Home menu with commands: View Movies, Add Movie, Delete Movie."""
     while True:
         print("=== Home ===")
@@ -519,14 +979,15 @@ def home_menu(username: str) -> None:
         print(" You can also delete the movie in (4)delete movie. ")
         print("=================================")
 
-        choice = input("Select a command: ").strip().lower()
+        choice = _input("Select a command: ").strip().lower()
 
         if choice == "1":
-            view_movies(username)
+            view_movies(session)
         elif choice == "2":
-            add_movie(username)
+            add_movie(session.username)
+            session.mtime_ns = -1
         elif choice == "3":
-            delete_movie_from_home(username)
+            delete_movie_from_home(session)
         elif choice in {"q", "quit", "exit"}:
             print("\nGoodbye!\n")
             return
@@ -543,15 +1004,15 @@ def main() -> None:
         USERS_FILE,
         USERS_FIELDS,
         seed_rows=[
-            {"username": "demo", "password": "demo123"},
-            {"username": "alice", "password": "password"},
+            ("demo", "demo123"),
+            ("alice", "password"),
         ],
     )
     ensure_csv_file(MOVIES_FILE, MOVIES_FIELDS)
 
     users = load_users()
     username = authenticate(users)
-    home_menu(username)
+    home_menu(Session(username))
 
 
 if __name__ == "__main__":